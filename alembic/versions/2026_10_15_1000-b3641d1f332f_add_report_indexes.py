@@ -0,0 +1,50 @@
+"""add report indexes, drop redundant primary key indexes
+
+Revision ID: b3641d1f332f
+Revises: cc5f08c67c8e
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3641d1f332f'
+down_revision: Union[str, None] = 'cc5f08c67c8e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_payments_type_date', 'payments', ['type_id', 'payment_date'], unique=False)
+    op.create_index(op.f('ix_payments_credit_id'), 'payments', ['credit_id'], unique=False)
+    op.create_index('ix_plans_period_category', 'plans', ['period', 'category_id'], unique=False)
+    op.create_index(op.f('ix_credits_user_id'), 'credits', ['user_id'], unique=False)
+    # The primary keys are already covered by the clustered index
+    op.drop_index(op.f('ix_payments_id'), table_name='payments')
+    op.drop_index(op.f('ix_plans_id'), table_name='plans')
+    op.drop_index(op.f('ix_credits_id'), table_name='credits')
+    op.drop_index(op.f('ix_users_id'), table_name='users')
+    op.drop_index(op.f('ix_dictionary_id'), table_name='dictionary')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_dictionary_id'), 'dictionary', ['id'], unique=False)
+    op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
+    op.create_index(op.f('ix_credits_id'), 'credits', ['id'], unique=False)
+    op.create_index(op.f('ix_plans_id'), 'plans', ['id'], unique=False)
+    op.create_index(op.f('ix_payments_id'), 'payments', ['id'], unique=False)
+    # MySQL silently drops the implicit foreign key indexes once the indexes
+    # above exist, so restore them before dropping ours
+    op.create_index('user_id', 'credits', ['user_id'], unique=False)
+    op.drop_index(op.f('ix_credits_user_id'), table_name='credits')
+    op.drop_index('ix_plans_period_category', table_name='plans')
+    op.create_index('credit_id', 'payments', ['credit_id'], unique=False)
+    op.drop_index(op.f('ix_payments_credit_id'), table_name='payments')
+    op.create_index('type_id', 'payments', ['type_id'], unique=False)
+    op.drop_index('ix_payments_type_date', table_name='payments')
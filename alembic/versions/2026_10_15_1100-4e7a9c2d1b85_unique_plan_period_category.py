@@ -0,0 +1,63 @@
+"""unique plan period category
+
+Revision ID: 4e7a9c2d1b85
+Revises: b3641d1f332f
+Create Date: 2026-10-15 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e7a9c2d1b85'
+down_revision: Union[str, None] = 'b3641d1f332f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Uploads used to accept several plans for the same period and category. The year
+    # report already summed them, so merge each group into its oldest row with the
+    # summed amount and delete the rest before adding the unique constraint
+    op.execute(
+        """
+        UPDATE plans
+        JOIN (
+            SELECT MIN(id) AS keep_id, SUM(sum) AS total
+            FROM plans
+            GROUP BY period, category_id
+            HAVING COUNT(*) > 1
+        ) AS duplicates ON plans.id = duplicates.keep_id
+        SET plans.sum = duplicates.total
+        """
+    )
+    op.execute(
+        """
+        DELETE plans
+        FROM plans
+        JOIN (
+            SELECT period, category_id, MIN(id) AS keep_id
+            FROM plans
+            GROUP BY period, category_id
+            HAVING COUNT(*) > 1
+        ) AS duplicates
+            ON plans.period = duplicates.period
+            AND plans.category_id = duplicates.category_id
+            AND plans.id <> duplicates.keep_id
+        """
+    )
+    
+    # The unique constraint serves the same lookups as the plain index it replaces
+    op.create_unique_constraint('uq_plans_period_category', 'plans', ['period', 'category_id'])
+    op.drop_index('ix_plans_period_category', table_name='plans')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Merged duplicate plans are not split back apart
+    op.create_index('ix_plans_period_category', 'plans', ['period', 'category_id'], unique=False)
+    op.drop_constraint('uq_plans_period_category', 'plans', type_='unique')
@@ -0,0 +1,30 @@
+"""add covering report indexes
+
+Revision ID: 9d2f5e8a6c31
+Revises: 4e7a9c2d1b85
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d2f5e8a6c31'
+down_revision: Union[str, None] = '4e7a9c2d1b85'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_payments_date_type_sum', 'payments', ['payment_date', 'type_id', 'sum'], unique=False)
+    op.create_index('ix_credits_issuance_date_body', 'credits', ['issuance_date', 'body'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_credits_issuance_date_body', table_name='credits')
+    op.drop_index('ix_payments_date_type_sum', table_name='payments')
@@ -0,0 +1,31 @@
+"""widen payments credit index
+
+Revision ID: 71c3b0e4f9a2
+Revises: 9d2f5e8a6c31
+Create Date: 2026-10-15 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '71c3b0e4f9a2'
+down_revision: Union[str, None] = '9d2f5e8a6c31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The new index leads with credit_id, so it still backs the foreign key
+    op.create_index('ix_payments_credit_type_sum', 'payments', ['credit_id', 'type_id', 'sum'], unique=False)
+    op.drop_index(op.f('ix_payments_credit_id'), table_name='payments')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_payments_credit_id'), 'payments', ['credit_id'], unique=False)
+    op.drop_index('ix_payments_credit_type_sum', table_name='payments')
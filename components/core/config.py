@@ -1,4 +1,4 @@
-from functools import lru_cache
+from functools import lru_cache, cached_property
 from typing import Optional
 from pydantic_settings import BaseSettings
 
@@ -12,6 +12,17 @@ class Settings(BaseSettings):
     DB_PORT: int = 3306
     DB_NAME: str = "FastAPI_TEST"
 
+    # Connection pool settings
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_PRE_PING: bool = False  # Issues an extra SELECT 1 on every checkout
+    DB_POOL_RECYCLE: int = 1800  # Seconds, keep below MySQL wait_timeout
+
+    # JWT settings
+    SECRET_KEY: str = "your-secret-key-here"  # In production, use a secure secret key
+    ALGORITHM: str = "HS256"
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+
     # API settings
     API_VERSION: str = "v1"
     DEBUG: bool = False
@@ -22,14 +33,14 @@ class Settings(BaseSettings):
         case_sensitive = True
         validate_default = True  # Updated from validate_all to validate_default for Pydantic v2
 
-    @property
+    @cached_property
     def sync_db_url(self) -> str:
         """Get synchronous database URL."""
         if self.DB_URL:
             return self.DB_URL.replace("mysql+aiomysql", "mysql+pymysql")
         return f"mysql+pymysql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
 
-    @property
+    @cached_property
     def async_db_url(self) -> str:
         """Get asynchronous database URL."""
         if self.DB_URL:
@@ -1,9 +1,11 @@
 """Core classes and mixins for DB connections"""
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import Any, Optional, cast
 from typing import Callable, AsyncContextManager
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.asyncio import create_async_engine
@@ -20,15 +22,26 @@ class DatabaseManager:
     def __init__(self, engine: Optional[AsyncEngine] = None) -> None:
         """Initialize DatabaseManager with optional engine for testing."""
         self.engine = engine or self._create_engine()
+        self._session_maker = cast(
+            SessionMaker,
+            sessionmaker(
+                self.engine,
+                class_=AsyncSession,
+                expire_on_commit=False,
+                autocommit=False,
+                autoflush=False,
+            ),
+        )
 
     def _create_engine(self) -> AsyncEngine:
         """Create async engine for MySQL connection."""
         return create_async_engine(
             settings.async_db_url,
             echo=False,  # Set to True for SQL query logging
-            pool_pre_ping=True,  # Enable connection health checks
-            pool_size=5,  # Connection pool size
-            max_overflow=10,  # Maximum number of connections that can be created beyond pool_size
+            pool_pre_ping=settings.DB_POOL_PRE_PING,  # Connection health checks on checkout
+            pool_recycle=settings.DB_POOL_RECYCLE,  # Recycle connections before the server drops them
+            pool_size=settings.DB_POOL_SIZE,  # Connection pool size
+            max_overflow=settings.DB_MAX_OVERFLOW,  # Maximum number of connections that can be created beyond pool_size
         )
     
     def get_session(self) -> SessionMaker:
@@ -36,16 +49,16 @@ class DatabaseManager:
         if not self.engine:
             raise ValueError("Database engine wasn't initialized")
     
-        return cast(
-            SessionMaker,
-            sessionmaker(
-                self.engine,
-                class_=AsyncSession,
-                expire_on_commit=False,
-                autocommit=False,
-                autoflush=False,
-            ),
-        )
+        return self._session_maker
+
+    async def warm_up(self, connections: int) -> None:
+        """Open pool connections up front so first requests skip the connect handshake."""
+        async def _connect() -> None:
+            async with self.engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+
+        # Connect concurrently so that each task checks out its own connection
+        await asyncio.gather(*(_connect() for _ in range(connections)))
 
     @asynccontextmanager
     async def get_db(self) -> AsyncContextManager[AsyncSession]:
@@ -1,11 +1,13 @@
 """Database initialization and dependency injection."""
 
+import logging
 from typing import AsyncGenerator
 
 import fastapi
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from components.core.config import get_settings
 from components.core.database import DatabaseManager
 # Import all models to ensure they're registered
 import components.user.models
@@ -14,9 +16,19 @@ import components.payment.models
 import components.dictionary.models
 import components.plan.models
 
+logger = logging.getLogger(__name__)
+
 # Create a single instance of DatabaseManager
 db_manager = DatabaseManager()
 
+async def warm_up_pool() -> None:
+    """Fill the connection pool before serving requests, if the database is reachable."""
+    try:
+        await db_manager.warm_up(get_settings().DB_POOL_SIZE)
+    except Exception as e:
+        # Best effort only: the pool still fills lazily once the database is up
+        logger.warning("Could not warm up the database pool, connecting on demand: %s", e)
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """FastAPI dependency for getting database sessions."""
     async with db_manager.get_db() as session:
@@ -25,4 +37,5 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 def init_db(app: fastapi.FastAPI) -> None:
     """Initialize database connection."""
     # Add database session dependency to the app
-    app.dependency_overrides[AsyncSession] = get_db 
\ No newline at end of file
+    app.dependency_overrides[AsyncSession] = get_db
+    app.add_event_handler("startup", warm_up_pool)
@@ -1,48 +1,52 @@
 """Security utilities for JWT and password handling."""
 
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Optional
 import hashlib
-import os
-from jose import JWTError, jwt
+import hmac
+import time
+import bcrypt
+from jose import JWTError, jwk, jwt
 from components.core.config import get_settings
 
 settings = get_settings()
 
 # JWT Configuration
-SECRET_KEY = "your-secret-key-here"  # In production, use a secure secret key
-ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 30
+SECRET_KEY = settings.SECRET_KEY
+ALGORITHM = settings.ALGORITHM
+ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
+
+# Key object built once and reused for signing and verifying every token
+_JWT_KEY = jwk.construct(SECRET_KEY, ALGORITHM)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
+    if hashed_password.startswith("$2"):
+        return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+    # Hashes created before the switch to bcrypt
     salt, stored_hash = hashed_password.split(':')
-    return get_password_hash(plain_password, salt) == hashed_password
+    return hmac.compare_digest(_get_legacy_password_hash(plain_password, salt), hashed_password)
+
+def get_password_hash(password: str) -> str:
+    """Generate password hash using bcrypt."""
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
 
-def get_password_hash(password: str, salt: str = None) -> str:
-    """Generate password hash using SHA256 with salt."""
-    if salt is None:
-        salt = os.urandom(32).hex()
-    hash_obj = hashlib.sha256()
-    hash_obj.update(salt.encode())
-    hash_obj.update(password.encode())
-    return f"{salt}:{hash_obj.hexdigest()}"
+def _get_legacy_password_hash(password: str, salt: str) -> str:
+    """Generate legacy password hash using SHA256 with salt."""
+    return f"{salt}:{hashlib.sha256(salt.encode() + password.encode()).hexdigest()}"
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a new JWT access token."""
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=15)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    expires_in = int(expires_delta.total_seconds()) if expires_delta else 15 * 60
+    to_encode["exp"] = int(time.time()) + expires_in
+    encoded_jwt = jwt.encode(to_encode, _JWT_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 def verify_token(token: str) -> Optional[dict]:
     """Verify a JWT token and return its payload."""
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, _JWT_KEY, algorithms=[ALGORITHM])
         return payload
     except JWTError:
         return None 
\ No newline at end of file
@@ -1,6 +1,6 @@
 """Credit model for the database."""
 
-from sqlalchemy import Column, Integer, DateTime, ForeignKey, Numeric
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Numeric, Index
 from sqlalchemy.orm import relationship
 
 from components.core.database import Base
@@ -9,9 +9,13 @@ from components.core.database import Base
 class Credit(Base):
     """Credit model representing a loan in the system."""
     __tablename__ = "credits"
+    __table_args__ = (
+        # Covers the issued amount aggregates, which range over issuance_date
+        Index("ix_credits_issuance_date_body", "issuance_date", "body"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     issuance_date = Column(DateTime, nullable=False)
     return_date = Column(DateTime, nullable=False)
     actual_return_date = Column(DateTime, nullable=True)
@@ -10,7 +10,7 @@ class Dictionary(Base):
     """Dictionary model for storing reference data."""
     __tablename__ = "dictionary"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String(100), unique=True, nullable=False)
 
     # Relationships
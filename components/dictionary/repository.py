@@ -0,0 +1,49 @@
+"""Repository for dictionary operations."""
+
+import asyncio
+import time
+from typing import Dict, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from components.dictionary.models import Dictionary
+
+# How long loaded categories are reused, in seconds; the dictionary is near-static
+CATEGORIES_TTL = 60
+
+_categories: Optional[Dict[int, str]] = None
+_categories_loaded_at = 0.0
+_categories_lock = asyncio.Lock()
+
+
+class DictionaryRepository:
+    """
+    Repository for dictionary operations.
+    
+    The dictionary is assumed to be quasi-static: it is only written by the seed
+    and import scripts, so categories are cached per process and picked up after
+    CATEGORIES_TTL seconds rather than invalidated on write.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize repository with database session."""
+        self.session = session
+
+    async def get_categories(self) -> Dict[int, str]:
+        """Get category names by ID, cached in-process for CATEGORIES_TTL seconds."""
+        global _categories, _categories_loaded_at
+        
+        if _categories is None or time.monotonic() - _categories_loaded_at > CATEGORIES_TTL:
+            # Let only one request reload the categories when the cache expires
+            async with _categories_lock:
+                if _categories is None or time.monotonic() - _categories_loaded_at > CATEGORIES_TTL:
+                    result = await self.session.execute(select(Dictionary.id, Dictionary.name))
+                    _categories = dict(result.all())
+                    _categories_loaded_at = time.monotonic()
+        
+        return _categories
+
+    async def get_category_ids(self) -> Dict[str, int]:
+        """Get category IDs by name."""
+        categories = await self.get_categories()
+        return {name: category_id for category_id, name in categories.items()}
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 class DictionaryBase(BaseModel):
     name: str
@@ -10,5 +10,4 @@ class DictionaryCreate(DictionaryBase):
 class DictionaryRead(DictionaryBase):
     id: int
 
-    class Config:
-        orm_mode = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
@@ -1,6 +1,6 @@
 """Payment model for the database."""
 
-from sqlalchemy import Column, Integer, DateTime, ForeignKey, Numeric
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Numeric, Index
 from sqlalchemy.orm import relationship
 
 from components.core.database import Base
@@ -9,8 +9,15 @@ from components.core.database import Base
 class Payment(Base):
     """Payment model for storing loan payments."""
     __tablename__ = "payments"
+    __table_args__ = (
+        Index("ix_payments_type_date", "type_id", "payment_date"),
+        # Covers the yearly per-month aggregation, which ranges over payment_date only
+        Index("ix_payments_date_type_sum", "payment_date", "type_id", "sum"),
+        # Covers the per-credit payment totals split by type
+        Index("ix_payments_credit_type_sum", "credit_id", "type_id", "sum"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     sum = Column(Numeric(10, 2), nullable=False)
     payment_date = Column(DateTime, nullable=False)
     credit_id = Column(Integer, ForeignKey("credits.id"), nullable=False)
@@ -1,6 +1,6 @@
 """Plan model for the database."""
 
-from sqlalchemy import Column, Integer, Date, ForeignKey, Numeric
+from sqlalchemy import Column, Integer, Date, ForeignKey, Numeric, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 from components.core.database import Base
@@ -9,8 +9,11 @@ from components.core.database import Base
 class Plan(Base):
     """Plan model for storing planned loan amounts."""
     __tablename__ = "plans"
+    __table_args__ = (
+        UniqueConstraint("period", "category_id", name="uq_plans_period_category"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     period = Column(Date, nullable=False)  # First day of the month
     sum = Column(Numeric(10, 2), nullable=False)
     category_id = Column(Integer, ForeignKey("dictionary.id"), nullable=False)
@@ -1,25 +1,81 @@
 """Repository for plan operations."""
 
-from datetime import date, datetime
-from typing import List, Dict, Tuple, BinaryIO
-import pandas as pd
-from sqlalchemy import select, func
+import asyncio
+import math
+import time
+from collections import defaultdict
+from datetime import date
+from typing import List, Dict, Tuple, BinaryIO, Optional
+from sqlalchemy import select, func, extract, insert, cast, case, bindparam, Date, Double, Row
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 import csv
+import io
 
+from components.core.database import SessionMaker
 from components.plan.models import Plan
 from components.credit.models import Credit
 from components.payment.models import Payment
 from components.dictionary.models import Dictionary
+from components.dictionary.repository import DictionaryRepository
 from components.plan import schemas
 
+# How long report results are reused, in seconds; plan uploads clear them right away
+YEAR_PERFORMANCE_TTL = 60
+PLANS_PERFORMANCE_TTL = 60
+# Upper bound on cached reports per method, as the keys come from request parameters
+REPORT_CACHE_SIZE = 64
+
+_year_performance_cache: Dict[int, Tuple[float, schemas.YearSummary]] = {}
+_plans_performance_cache: Dict[date, Tuple[float, List[schemas.CategoryPerformance]]] = {}
+
+# Credits with their payment totals split by type, one row per credit
+# Assuming тіло (body) is for credit body payments, відсотки (interest) is for interest payments
+_CREDITS_WITH_PAYMENTS_QUERY = (
+    select(
+        Credit.user_id,
+        Credit.id,
+        cast(Credit.issuance_date, Date),
+        cast(Credit.return_date, Date),
+        cast(Credit.actual_return_date, Date),
+        cast(Credit.body, Double),
+        cast(Credit.percent, Double),
+        cast(func.coalesce(func.sum(Payment.sum), 0), Double),
+        cast(func.coalesce(func.sum(case((Dictionary.name == "тіло", Payment.sum))), 0), Double),
+        cast(func.coalesce(func.sum(case((Dictionary.name == "відсотки", Payment.sum))), 0), Double)
+    )
+    .outerjoin(Payment, Payment.credit_id == Credit.id)
+    .outerjoin(Dictionary, Payment.type_id == Dictionary.id)
+    .group_by(Credit.id)
+)
+# Built once at import as these run on every user credits and open loans request
+_USER_CREDITS_QUERY = _CREDITS_WITH_PAYMENTS_QUERY.where(Credit.user_id == bindparam("user_id"))
+_OPEN_CREDITS_QUERY = _CREDITS_WITH_PAYMENTS_QUERY.where(Credit.actual_return_date.is_(None))
+
 
 class PlanRepository:
     """Repository for plan operations."""
 
-    def __init__(self, session: AsyncSession):
-        """Initialize repository with database session."""
+    def __init__(self, session: AsyncSession, session_maker: Optional[SessionMaker] = None):
+        """
+        Initialize repository with database session.
+        
+        If a session maker is given, independent report queries run concurrently,
+        each on its own session, since a single AsyncSession cannot run queries in parallel.
+        """
         self.session = session
+        self.session_maker = session_maker
+
+    async def _execute_concurrently(self, *statements) -> List[List[Row]]:
+        """Execute independent statements and return the rows of each one."""
+        if self.session_maker is None:
+            return [(await self.session.execute(statement)).all() for statement in statements]
+        
+        async def execute(statement) -> List[Row]:
+            async with self.session_maker() as session:
+                return (await session.execute(statement)).all()
+        
+        return list(await asyncio.gather(*(execute(statement) for statement in statements)))
 
     async def get_user_credits(self, user_id: int) -> List[schemas.UserCredit]:
         """
@@ -41,91 +97,64 @@ class PlanRepository:
             - The amount of payments on the body
             - Amount of interest payments
         """
-        # Get user's credits
-        result = await self.session.execute(
-            select(Credit).where(Credit.user_id == user_id)
-        )
-        credits = result.scalars().all()
-        
-        if not credits:
-            return []
+        # Get user's credits with their payment totals split by type in one aggregate query
+        result = await self.session.execute(_USER_CREDITS_QUERY, {"user_id": user_id})
+        today = date.today()
+        return [self._to_user_credit(row, today) for row in result.all()]
+
+    async def get_open_credits_by_user(self) -> Dict[int, List[schemas.UserCredit]]:
+        """Get the open credits of all users in one query, grouped by user ID."""
+        result = await self.session.execute(_OPEN_CREDITS_QUERY)
+        today = date.today()
         
-        credits_data = []
+        credits_by_user = defaultdict(list)
+        for row in result.all():
+            credits_by_user[row[0]].append(self._to_user_credit(row, today))
+        return credits_by_user
+
+    @staticmethod
+    def _to_user_credit(row: Row, today: date) -> schemas.UserCredit:
+        """Build a UserCredit from a row of the credits with payments query."""
+        (
+            _, credit_id, issuance_date, return_date, actual_return_date, loan_amount, accrued_interest,
+            total_payment_amount, body_payments, interest_payments
+        ) = row
         
-        # Get dictionary categories to identify payment types
-        result = await self.session.execute(select(Dictionary))
-        categories = {category.id: category.name for category in result.scalars().all()}
+        # Check if loan is closed (has actual return date)
+        is_closed = actual_return_date is not None
         
-        # Find category IDs for body and interest payments
-        # Assuming тіло (body) is for credit body payments, відсотки (interest) is for interest payments
-        body_category_id = next((k for k, v in categories.items() if v == "тіло"), None)
-        interest_category_id = next((k for k, v in categories.items() if v == "відсотки"), None)
+        # Create the UserCredit object, skipping validation as the values come from the DB
+        user_credit = schemas.UserCredit.model_construct(
+            credit_id=credit_id,
+            issuance_date=issuance_date,
+            is_closed=is_closed,
+            closed_loan_data=None,
+            open_loan_data=None
+        )
         
-        for credit in credits:
-            # Get payments for this credit
-            result = await self.session.execute(
-                select(Payment)
-                .where(Payment.credit_id == credit.id)
-                .order_by(Payment.payment_date)
+        if is_closed:
+            # For closed loans
+            user_credit.closed_loan_data = schemas.ClosedLoanData.model_construct(
+                repayment_date=actual_return_date,
+                loan_amount=loan_amount,
+                accrued_interest=accrued_interest,
+                payment_amount=total_payment_amount
             )
-            payments = result.scalars().all()
+        else:
+            # For open loans
+            # Calculate overdue days
+            overdue_days = max(0, (today - return_date).days) if today > return_date else 0
             
-            # Calculate payment amounts by type
-            total_payment_amount = sum(float(payment.sum) for payment in payments)
-            body_payments = sum(
-                float(payment.sum) 
-                for payment in payments 
-                if payment.type_id == body_category_id
+            user_credit.open_loan_data = schemas.OpenLoanData.model_construct(
+                repayment_deadline=return_date,
+                overdue_days=overdue_days,
+                loan_amount=loan_amount,
+                accrued_interest=accrued_interest,
+                body_payments=body_payments,
+                interest_payments=interest_payments
             )
-            interest_payments = sum(
-                float(payment.sum) 
-                for payment in payments 
-                if payment.type_id == interest_category_id
-            )
-            
-            # Check if loan is closed (has actual return date)
-            is_closed = credit.actual_return_date is not None
-            
-            # Create the UserCredit object
-            user_credit = schemas.UserCredit(
-                credit_id=credit.id,
-                issuance_date=credit.issuance_date,
-                is_closed=is_closed
-            )
-            
-            if is_closed:
-                # For closed loans
-                # Convert actual_return_date to date if it's a datetime
-                repayment_date = credit.actual_return_date.date() if isinstance(credit.actual_return_date, datetime) else credit.actual_return_date
-                
-                user_credit.closed_loan_data = schemas.ClosedLoanData(
-                    repayment_date=repayment_date,
-                    loan_amount=float(credit.body),
-                    accrued_interest=float(credit.percent),
-                    payment_amount=total_payment_amount
-                )
-            else:
-                # For open loans
-                # Calculate overdue days
-                today = date.today()
-                
-                # Convert return_date to date if it's a datetime
-                return_date = credit.return_date.date() if isinstance(credit.return_date, datetime) else credit.return_date
-                
-                overdue_days = max(0, (today - return_date).days) if today > return_date else 0
-                
-                user_credit.open_loan_data = schemas.OpenLoanData(
-                    repayment_deadline=return_date,
-                    overdue_days=overdue_days,
-                    loan_amount=float(credit.body),
-                    accrued_interest=float(credit.percent),
-                    body_payments=body_payments,
-                    interest_payments=interest_payments
-                )
-            
-            credits_data.append(user_credit)
         
-        return credits_data
+        return user_credit
 
 
     async def get_plans_performance(self, as_of_date: date) -> List[schemas.CategoryPerformance]:
@@ -143,78 +172,67 @@ class PlanRepository:
             - Amount of credits issued or payments collected
             - % of plan fulfillment
         """
+        cached = _plans_performance_cache.get(as_of_date)
+        if cached and time.monotonic() - cached[0] <= PLANS_PERFORMANCE_TTL:
+            return cached[1]
+        
         # Determine the month of the given date
         plan_month = date(as_of_date.year, as_of_date.month, 1)
         
-        # Get all plans for the month
-        result = await self.session.execute(
-            select(Plan).where(Plan.period == plan_month)
+        # For "Issue" (видача) plans - sum of credit.body for credits issued in this period
+        issued_amount = (
+            select(func.coalesce(func.sum(Credit.body), 0))
+            .where(
+                Credit.issuance_date >= plan_month,
+                Credit.issuance_date <= as_of_date
+            )
+            .scalar_subquery()
+        )
+        # For other plans - sum of payments of the plan's category in this period
+        paid_amount = (
+            select(func.coalesce(func.sum(Payment.sum), 0))
+            .where(
+                Payment.payment_date >= plan_month,
+                Payment.payment_date <= as_of_date,
+                Payment.type_id == Plan.category_id
+            )
+            .correlate(Plan)
+            .scalar_subquery()
+        )
+        actual_amount = case((Dictionary.name == "видача", issued_amount), else_=paid_amount)
+        # Divide as doubles, as DECIMAL division is limited by div_precision_increment
+        fulfillment_percentage = case(
+            (Plan.sum > 0, cast(actual_amount, Double) / cast(Plan.sum, Double) * 100),
+            else_=0
         )
-        plans = result.scalars().all()
-        
-        if not plans:
-            return []
-        
-        # Get dictionary categories to identify issue and collection categories
-        result = await self.session.execute(select(Dictionary))
-        categories = {category.id: category.name for category in result.scalars().all()}
-        
-        # Find category IDs for issue and collection
-        # Using the actual names from the output: "видача" (issue) and "збір" (collection)
-        issue_category_id = next((k for k, v in categories.items() if v == "видача"), None)
-        collection_category_id = next((k for k, v in categories.items() if v == "збір"), None)
         
-
-        performance_data = []
+        # Get all plans for the month with their actual amounts and fulfillment in one query
+        result = await self.session.execute(
+            select(
+                Dictionary.name,
+                cast(Plan.sum, Double),
+                cast(actual_amount, Double),
+                cast(fulfillment_percentage, Double)
+            )
+            .select_from(Plan)
+            .join(Dictionary, Plan.category_id == Dictionary.id)
+            .where(Plan.period == plan_month)
+        )
         
-        for plan in plans:
-            category_id = plan.category_id
-            category_name = categories.get(category_id, f"Category {category_id}")
-            
-            # Calculate actual amounts depending on category
-            if category_id == issue_category_id:
-                # For "Issue" category - sum of credit.body for credits issued in this period
-                query = select(func.sum(Credit.body)).where(
-                    Credit.issuance_date >= plan_month,
-                    Credit.issuance_date <= as_of_date
-                )
-                result = await self.session.execute(query)
-                actual_amount = result.scalar() or 0
-            elif category_id == collection_category_id:
-                # For "Collection" category - sum of payments in this period
-                query = select(func.sum(Payment.sum)).join(Credit, Payment.credit_id == Credit.id).where(
-                    Payment.payment_date >= plan_month,
-                    Payment.payment_date <= as_of_date,
-                    Payment.type_id == category_id
-                )
-                result = await self.session.execute(query)
-                actual_amount = result.scalar() or 0
-            else:
-                # For other categories - sum of payments of that type
-                query = select(func.sum(Payment.sum)).join(Credit, Payment.credit_id == Credit.id).where(
-                    Payment.payment_date >= plan_month,
-                    Payment.payment_date <= as_of_date,
-                    Payment.type_id == category_id
-                )
-                result = await self.session.execute(query)
-                actual_amount = result.scalar() or 0
-
-            # Calculate fulfillment percentage
-            plan_amount = float(plan.sum)
-            actual_amount = float(actual_amount)
-            fulfillment_percentage = (actual_amount / plan_amount * 100) if plan_amount > 0 else 0
-            
-
-            # Add to result
-            performance_data.append(schemas.CategoryPerformance(
+        performances = [
+            schemas.CategoryPerformance.model_construct(
                 plan_month=plan_month,
                 category=category_name,
                 amount_from_the_plan=plan_amount,
-                issued_credits_or_payments=actual_amount,
-                performance_percentage=fulfillment_percentage
-            ))
-        
-        return performance_data
+                issued_credits_or_payments=actual,
+                performance_percentage=percentage
+            )
+            for category_name, plan_amount, actual, percentage in result.all()
+        ]
+        if len(_plans_performance_cache) >= REPORT_CACHE_SIZE:
+            _plans_performance_cache.clear()
+        _plans_performance_cache[as_of_date] = (time.monotonic(), performances)
+        return performances
 
     async def get_year_performance(self, year: int) -> schemas.YearSummary:
         """
@@ -233,69 +251,99 @@ class PlanRepository:
         - % of the amount of issues for the month from the amount of issues for the year (issues_percentage_of_year)
         - % of the amount of payments for the month from the amount of payments for the year (payments_percentage_of_year)
         """
-        # Initialize the yearly totals
-        total_credits_issued = 0
-        total_num_payments = 0
-        total_issued_credits_amount = 0
-        total_issued_credits_plan_amount = 0
-        total_collection_plan_amount = 0
-        total_collected_payments_amount = 0
-        
-        # Get dictionary categories to identify payment types
-        result = await self.session.execute(select(Dictionary))
-        categories = {category.id: category.name for category in result.scalars().all()}
+        cached = _year_performance_cache.get(year)
+        if cached and time.monotonic() - cached[0] <= YEAR_PERFORMANCE_TTL:
+            return cached[1]
         
-        # Find category IDs for issue and collection
-        # Using the actual names from the output: "видача" (issue) and "збір" (collection)
-        issue_category_id = next((k for k, v in categories.items() if v == "видача"), None)
-        collection_category_id = next((k for k, v in categories.items() if v == "збір"), None)
+        year_start = date(year, 1, 1)
+        year_end = date(year + 1, 1, 1)
         
-        # Get yearly data for credits issued
-        result = await self.session.execute(
-            select(Credit)
+        # Number and amount of credits issued per month
+        credit_month = extract("month", Credit.issuance_date)
+        credits_query = (
+            select(credit_month, func.count(Credit.id), cast(func.sum(Credit.body), Double))
             .where(
-                Credit.issuance_date >= date(year, 1, 1),
-                Credit.issuance_date < date(year + 1, 1, 1)
+                Credit.issuance_date >= year_start,
+                Credit.issuance_date < year_end
             )
+            .group_by(credit_month)
         )
-        yearly_credits = list(result.scalars().all())
-        total_credits_issued = len(yearly_credits)
-        yearly_credit_amount = sum(float(credit.body) for credit in yearly_credits)
-        total_issued_credits_amount = yearly_credit_amount
         
-        # Get yearly data for payments
-        result = await self.session.execute(
-            select(Payment)
-            .join(Credit, Payment.credit_id == Credit.id)
+        # Number and amount of payments per month and payment type
+        payment_month = extract("month", Payment.payment_date)
+        payments_query = (
+            select(payment_month, Payment.type_id, func.count(Payment.id), cast(func.sum(Payment.sum), Double))
             .where(
-                Payment.payment_date >= date(year, 1, 1),
-                Payment.payment_date < date(year + 1, 1, 1)
+                Payment.payment_date >= year_start,
+                Payment.payment_date < year_end
             )
+            .group_by(payment_month, Payment.type_id)
         )
-        yearly_payments = list(result.scalars().all())
-        total_num_payments = len(yearly_payments)
-        yearly_payment_amount = sum(float(payment.sum) for payment in yearly_payments)
-        
-        # Split payments by category
-        collection_payments = [p for p in yearly_payments if p.type_id == collection_category_id]
-        total_collected_payments_amount = sum(float(payment.sum) for payment in collection_payments)
         
-        # Get yearly plan amounts
-        result = await self.session.execute(
-            select(Plan)
+        # Plan amounts per month and category
+        plan_month = extract("month", Plan.period)
+        plans_query = (
+            select(plan_month, Plan.category_id, cast(func.sum(Plan.sum), Double))
             .where(
-                Plan.period >= date(year, 1, 1),
-                Plan.period < date(year + 1, 1, 1)
+                Plan.period >= year_start,
+                Plan.period < year_end
+            )
+            .group_by(plan_month, Plan.category_id)
+        )
+        
+        # The queries are independent, so run them concurrently
+        credit_rows, payment_rows, plan_rows = await self._execute_concurrently(
+            credits_query,
+            payments_query,
+            plans_query
+        )
+        
+        # Find category IDs for issue and collection
+        # Using the actual names from the output: "видача" (issue) and "збір" (collection)
+        category_ids = await DictionaryRepository(self.session).get_category_ids()
+        issue_category_id = category_ids.get("видача")
+        collection_category_id = category_ids.get("збір")
+        
+        credits_by_month = {
+            int(month): (count, amount)
+            for month, count, amount in credit_rows
+        }
+        
+        payments_by_month = defaultdict(dict)
+        for month, type_id, count, amount in payment_rows:
+            payments_by_month[int(month)][type_id] = (count, amount)
+        
+        plans_by_month = defaultdict(dict)
+        for month, category_id, amount in plan_rows:
+            plans_by_month[int(month)][category_id] = amount
+        
+        # Calculate the yearly totals from the monthly aggregates
+        total_credits_issued = sum(count for count, _ in credits_by_month.values())
+        total_issued_credits_amount = sum(amount for _, amount in credits_by_month.values())
+        yearly_credit_amount = total_issued_credits_amount
+        
+        month_payments_totals = {
+            month: (
+                sum(count for count, _ in by_type.values()),
+                sum(amount for _, amount in by_type.values())
             )
+            for month, by_type in payments_by_month.items()
+        }
+        total_num_payments = sum(count for count, _ in month_payments_totals.values())
+        yearly_payment_amount = sum(amount for _, amount in month_payments_totals.values())
+        total_collected_payments_amount = sum(
+            by_type.get(collection_category_id, (0, 0))[1]
+            for by_type in payments_by_month.values()
         )
-        yearly_plans = list(result.scalars().all())
         
-        # Get plan amounts by category
-        for plan in yearly_plans:
-            if plan.category_id == issue_category_id:
-                total_issued_credits_plan_amount += float(plan.sum)
-            elif plan.category_id == collection_category_id:
-                total_collection_plan_amount += float(plan.sum)
+        total_issued_credits_plan_amount = sum(
+            by_category.get(issue_category_id, 0)
+            for by_category in plans_by_month.values()
+        )
+        total_collection_plan_amount = sum(
+            by_category.get(collection_category_id, 0)
+            for by_category in plans_by_month.values()
+        )
         
         # Calculate overall percentages
         overall_issue_plan_fulfillment_percentage = (
@@ -312,58 +360,11 @@ class PlanRepository:
         
         # Process each month
         for month in range(1, 13):
-            month_start = date(year, month, 1)
-            month_end = date(year, month + 1, 1) if month < 12 else date(year + 1, 1, 1)
-            
-            # Get credits issued in this month
-            result = await self.session.execute(
-                select(Credit)
-                .where(
-                    Credit.issuance_date >= month_start,
-                    Credit.issuance_date < month_end
-                )
-            )
-            month_credits = list(result.scalars().all())
-            month_num_credits_issued = len(month_credits)
-            month_issued_credits_amount = sum(float(credit.body) for credit in month_credits)
-            
-            # Get payments made in this month
-            result = await self.session.execute(
-                select(Payment)
-                .join(Credit, Payment.credit_id == Credit.id)
-                .where(
-                    Payment.payment_date >= month_start,
-                    Payment.payment_date < month_end
-                )
-            )
-            month_payments = list(result.scalars().all())
-            month_num_payments = len(month_payments)
-            month_payment_amount = sum(float(payment.sum) for payment in month_payments)
-            
-            # Split payments by category
-            month_collected_payments = [p for p in month_payments if p.type_id == collection_category_id]
-            month_collected_payments_amount = sum(float(payment.sum) for payment in month_collected_payments)
-            
-            # Get plan amounts for this month
-            result = await self.session.execute(
-                select(Plan)
-                .where(
-                    Plan.period == month_start
-                )
-            )
-            month_plans = list(result.scalars().all())
-            
-            # Get plan amounts by category for this month
-            month_issue_plan_amount = sum(
-                float(plan.sum) 
-                for plan in month_plans 
-                if plan.category_id == issue_category_id
-            )
-            month_collection_plan_amount = sum(
-                float(plan.sum) 
-                for plan in month_plans 
-                if plan.category_id == collection_category_id
-            )
+            month_num_credits_issued, month_issued_credits_amount = credits_by_month.get(month, (0, 0))
+            month_num_payments, month_payment_amount = month_payments_totals.get(month, (0, 0))
+            month_collected_payments_amount = payments_by_month[month].get(collection_category_id, (0, 0))[1]
+            month_issue_plan_amount = plans_by_month[month].get(issue_category_id, 0)
+            month_collection_plan_amount = plans_by_month[month].get(collection_category_id, 0)
             
             # Calculate percentages
             month_issue_plan_fulfillment_percentage = (
@@ -383,8 +384,8 @@ class PlanRepository:
                 if yearly_payment_amount > 0 else 0
             )
             
-            # Add the monthly summary
-            monthly_summaries.append(schemas.MonthSummary(
+            # Add the monthly summary, skipping validation as the values come from SQL aggregates
+            monthly_summaries.append(schemas.MonthSummary.model_construct(
                 month=month,
                 year=year,
                 num_credits_issued=month_num_credits_issued,
@@ -399,8 +400,8 @@ class PlanRepository:
                 payments_percentage_of_year=month_payments_percentage_of_year
             ))
         
-        # Create and return the year summary
-        return schemas.YearSummary(
+        # Create, cache and return the year summary
+        year_summary = schemas.YearSummary.model_construct(
             year=year,
             total_credits_issued=total_credits_issued,
             total_issue_plan_amount=total_issued_credits_plan_amount,
@@ -412,6 +413,10 @@ class PlanRepository:
             overall_collection_plan_fulfillment_percentage=overall_collection_plan_fulfillment_percentage,
             monthly_summaries=monthly_summaries
         )
+        if len(_year_performance_cache) >= REPORT_CACHE_SIZE:
+            _year_performance_cache.clear()
+        _year_performance_cache[year] = (time.monotonic(), year_summary)
+        return year_summary
 
 
     async def upload_plans_from_csv(self, file_content: BinaryIO) -> Tuple[bool, str, List[Dict]]:
@@ -428,25 +433,39 @@ class PlanRepository:
             - List of errors if any (List[Dict])
         """
         errors = []
+        parsed_rows = []
+        file_plans = {}
         
         try:
-            # Read CSV file
-            content_str = file_content.read().decode('utf-8')
-            csv_reader = csv.DictReader(content_str.splitlines(), delimiter='\t')
+            categories = await DictionaryRepository(self.session).get_categories()
+            
+            # Read CSV file, decoding it as it is parsed
+            csv_reader = csv.reader(
+                io.TextIOWrapper(file_content, encoding='utf-8', newline=''),
+                delimiter='\t'
+            )
             
-            # Store rows for later processing
-            csv_rows = list(csv_reader)
+            # Validate required fields
+            header = next(csv_reader, [])
+            if not all(field in header for field in ['period', 'sum', 'category_id']):
+                return False, "CSV file must contain 'period', 'sum', and 'category_id' columns", []
+            period_index = header.index('period')
+            sum_index = header.index('sum')
+            category_index = header.index('category_id')
             
             # Validate all rows first
-            for row_num, row in enumerate(csv_rows, start=2):  # Start at 2 to account for header row
-                # Validate required fields
-                if not all(field in row for field in ['period', 'sum', 'category_id']):
-                    return False, "CSV file must contain 'period', 'sum', and 'category_id' columns", []
+            for row_num, row in enumerate(csv_reader, start=2):  # Start at 2 to account for header row
+                if not row:
+                    continue
+                
+                # Treat missing trailing values as empty
+                row += [''] * (len(header) - len(row))
+                period, sum_value, category_value = row[period_index], row[sum_index], row[category_index]
                 
                 # Validate period format and first day of month
                 try:
                     # Parse date in format DD.MM.YYYY
-                    day, month, year = map(int, row['period'].split('.'))
+                    day, month, year = map(int, period.split('.'))
                     plan_month = date(year, month, day)
                     
                     # Check if it's the first day of the month
@@ -459,14 +478,14 @@ class PlanRepository:
                 except Exception as e:
                     errors.append({
                         "row": row_num,
-                        "message": f"Invalid date format for period: {row['period']}. Expected DD.MM.YYYY"
+                        "message": f"Invalid date format for period: {period}. Expected DD.MM.YYYY"
                     })
                     continue
                 
                 # Validate sum
                 try:
-                    amount = float(row['sum'])
-                    if pd.isna(amount):
+                    amount = float(sum_value)
+                    if math.isnan(amount):
                         errors.append({
                             "row": row_num,
                             "message": "Sum cannot be empty"
@@ -475,19 +494,16 @@ class PlanRepository:
                 except Exception:
                     errors.append({
                         "row": row_num,
-                        "message": f"Invalid sum value: {row['sum']}"
+                        "message": f"Invalid sum value: {sum_value}"
                     })
                     continue
                 
                 # Validate category_id
                 try:
-                    category_id = int(row['category_id'])
+                    category_id = int(category_value)
                     
                     # Check if category exists
-                    result = await self.session.execute(
-                        select(Dictionary).where(Dictionary.id == category_id)
-                    )
-                    if not result.scalar_one_or_none():
+                    if category_id not in categories:
                         errors.append({
                             "row": row_num,
                             "message": f"Category ID {category_id} does not exist"
@@ -496,47 +512,63 @@ class PlanRepository:
                 except Exception:
                     errors.append({
                         "row": row_num,
-                        "message": f"Invalid category_id: {row['category_id']}"
+                        "message": f"Invalid category_id: {category_value}"
                     })
                     continue
                 
-                # Check if plan already exists
-                existing_plan = await self.session.execute(
-                    select(Plan).where(
-                        Plan.period == plan_month,
-                        Plan.category_id == category_id
-                    )
-                )
-                if existing_plan.scalar_one_or_none():
+                # Each period and category may only appear once, as plans are unique on them
+                first_row_num = file_plans.setdefault((plan_month, category_id), row_num)
+                if first_row_num != row_num:
                     errors.append({
                         "row": row_num,
-                        "message": f"Plan already exists for {plan_month} with category_id {category_id}"
+                        "message": f"Duplicate plan for {plan_month} with category_id {category_id} (already in row {first_row_num})"
                     })
                     continue
+                
+                parsed_rows.append((row_num, plan_month, amount, category_id))
+            
+            # Check which plans already exist with a single query for all periods in the file
+            if parsed_rows:
+                result = await self.session.execute(
+                    select(Plan.period, Plan.category_id).where(
+                        Plan.period.in_(list({plan_month for _, plan_month, _, _ in parsed_rows}))
+                    )
+                )
+                existing_plans = {(period, category_id) for period, category_id in result.all()}
+                
+                for row_num, plan_month, _, category_id in parsed_rows:
+                    if (plan_month, category_id) in existing_plans:
+                        errors.append({
+                            "row": row_num,
+                            "message": f"Plan already exists for {plan_month} with category_id {category_id}"
+                        })
+                errors.sort(key=lambda error: error["row"])
             
             # If we have any errors, return them without committing
             if errors:
                 return False, "Validation errors occurred", errors
             
-            # If no errors, process all rows and insert the plans
-            for row in csv_rows:
-                day, month, year = map(int, row['period'].split('.'))
-                plan_month = date(year, month, day)
-                category_id = int(row['category_id'])
-                amount = float(row['sum'])
-                
-                # Create and add plan
-                new_plan = Plan(
-                    period=plan_month,
-                    sum=amount,
-                    category_id=category_id
+            # If no errors, insert all plans with a single bulk INSERT
+            if parsed_rows:
+                await self.session.execute(
+                    insert(Plan),
+                    [
+                        {"period": plan_month, "sum": amount, "category_id": category_id}
+                        for _, plan_month, amount, category_id in parsed_rows
+                    ]
                 )
-                self.session.add(new_plan)
             
             # Commit all changes
             await self.session.commit()
+            _year_performance_cache.clear()
+            _plans_performance_cache.clear()
             return True, "Plans uploaded successfully", []
             
+        except IntegrityError:
+            # Another upload added the same plans after they were checked
+            await self.session.rollback()
+            return False, "Plans for some of these periods and categories already exist", []
         except Exception as e:
             # Handle any unexpected errors
+            await self.session.rollback()
             return False, f"Error processing file: {str(e)}", []
@@ -10,7 +10,7 @@ class User(Base):
     """User model representing a client in the system."""
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     login = Column(String(50), unique=True, nullable=False)
     password = Column(String(255), nullable=False)  # Hashed password
     registration_date = Column(Date, nullable=False)
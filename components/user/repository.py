@@ -1,5 +1,6 @@
 """Repository for user operations."""
 
+import asyncio
 from datetime import date
 from typing import List, Optional, Dict, Any
 from sqlalchemy import select
@@ -8,7 +9,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from components.user.models import User
 from components.user.schemas import UserCreate, User as UserSchema, UserUpdate
 from components.core.security import get_password_hash
-from components.credit.models import Credit
 from components.plan import schemas as plan_schemas
 
 
@@ -23,7 +23,7 @@ class UserRepository:
         """Create a new user."""
         db_user = User(
             login=user.login,
-            password=get_password_hash(user.password),
+            password=await asyncio.to_thread(get_password_hash, user.password),
             registration_date=date.today()
         )
         self.session.add(db_user)
@@ -72,7 +72,7 @@ class UserRepository:
 
         db_user.login = user.login
         if user.password:
-            db_user.password = get_password_hash(user.password)
+            db_user.password = await asyncio.to_thread(get_password_hash, user.password)
 
         await self.session.commit()
         await self.session.refresh(db_user)
@@ -108,43 +108,26 @@ class UserRepository:
         
         Returns a list of users with open loan information.
         """
-        # Find users with credits where actual_return_date is NULL (open loans)
-        result = await self.session.execute(
-            select(Credit.user_id)
-            .where(Credit.actual_return_date == None)
-            .distinct()
-        )
-        user_ids = [row[0] for row in result.all()]
+        # Get open loans (actual_return_date is NULL) of all users in one query
+        # We need to use the PlanRepository for this
+        from components.plan.repository import PlanRepository
+        plan_repo = PlanRepository(self.session)
+        open_loans_by_user = await plan_repo.get_open_credits_by_user()
         
-        if not user_ids:
+        if not open_loans_by_user:
             return []
         
         # Get user information for these IDs
-        users_with_loans = []
-        
-        for user_id in user_ids:
-            # Get user info
-            result = await self.session.execute(
-                select(User).where(User.id == user_id)
-            )
-            user = result.scalar_one_or_none()
-            
-            if user:
-                # Get open loans for this user
-                # We need to use the PlanRepository for this
-                from components.plan.repository import PlanRepository
-                plan_repo = PlanRepository(self.session)
-                credits = await plan_repo.get_user_credits(user_id)
-                
-                # Filter only open loans
-                open_loans = [credit for credit in credits if not credit.is_closed]
-                
-                if open_loans:
-                    users_with_loans.append({
-                        "user_id": user.id,
-                        "login": user.login,
-                        "registration_date": user.registration_date,
-                        "open_loans": open_loans
-                    })
+        result = await self.session.execute(
+            select(User).where(User.id.in_(list(open_loans_by_user))).order_by(User.id)
+        )
         
-        return users_with_loans
+        return [
+            {
+                "user_id": user.id,
+                "login": user.login,
+                "registration_date": user.registration_date,
+                "open_loans": open_loans_by_user[user.id]
+            }
+            for user in result.scalars().all()
+        ]
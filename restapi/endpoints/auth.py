@@ -1,5 +1,6 @@
 """Authentication endpoints for user login and registration."""
 
+import asyncio
 from datetime import date, timedelta
 from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -68,7 +69,7 @@ async def create_user(
     # Create new user
     user = User(
         login=user_in.login,
-        password=get_password_hash(user_in.password),
+        password=await asyncio.to_thread(get_password_hash, user_in.password),
         registration_date=date.today(),
     )
     db.add(user)
@@ -97,7 +98,8 @@ async def login(
     )
     user = result.scalar_one_or_none()
     
-    if not user or not verify_password(form_data.password, user.password):
+    # Password hashing is CPU-bound, keep it off the event loop
+    if not user or not await asyncio.to_thread(verify_password, form_data.password, user.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect login or password",
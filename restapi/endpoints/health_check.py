@@ -15,7 +15,7 @@ router = APIRouter(
 @router.get("/", response_model=schemas.HealthCheck)
 async def health_check() -> schemas.HealthCheck:
     """Check the health status of the service."""
-    return schemas.HealthCheck(
+    return schemas.HealthCheck.model_construct(
         service_name="FastAPI Test",
         status="healthy"
     )
\ No newline at end of file
@@ -6,7 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
 import io
 
-from components.core.init_db import get_db
+from components.core.init_db import get_db, db_manager
 from components.plan.repository import PlanRepository
 from components.plan import schemas
 from restapi.endpoints.auth import get_current_user
@@ -154,5 +154,5 @@ async def get_year_performance(
     - % of the amount of issues for the month from the amount of issues for the year
     - % of the amount of payments for the month from the amount of payments for the year
     """
-    repo = PlanRepository(db)
+    repo = PlanRepository(db, db_manager.get_session())
     return await repo.get_year_performance(year) 
\ No newline at end of file
@@ -49,14 +49,15 @@ async def import_data():
         await db.commit()
         
         print("Importing user data...")
+        # Use a default password for all imported users, hashed once as bcrypt is slow by design
+        default_password_hash = get_password_hash("password123")
         with open(data_dir / "users.csv", "r", encoding="utf-8") as f:
             reader = csv.DictReader(f, delimiter="\t")
             for row in reader:
                 user = User(
                     id=int(row["id"]),
                     login=row["login"],
-                    # Use a default password for all imported users
-                    password=get_password_hash("password123"),
+                    password=default_password_hash,
                     registration_date=parse_date(row["registration_date"])
                 )
                 db.add(user)
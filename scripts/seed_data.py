@@ -33,20 +33,21 @@ async def seed_data():
         await db.commit()
         
         # Create users
+        default_password_hash = get_password_hash("password123")
         users = [
             User(
                 login="john_doe",
-                password=get_password_hash("password123"),
+                password=default_password_hash,
                 registration_date=date(2024, 1, 1)
             ),
             User(
                 login="jane_smith",
-                password=get_password_hash("password123"),
+                password=default_password_hash,
                 registration_date=date(2024, 1, 15)
             ),
             User(
                 login="bob_wilson",
-                password=get_password_hash("password123"),
+                password=default_password_hash,
                 registration_date=date(2024, 2, 1)
             )
         ]